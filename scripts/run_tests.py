@@ -1,10 +1,18 @@
+import io
 import os
 import re
 import sys
+import glob
+import contextlib
+import mmap
+import functools
 import argparse
 import subprocess
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import atexit
+import copy
+
+# NumPy, imported together with the optional Numba by get_compiled_search.
+np = None
 
 # Constants for directory paths.
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -21,6 +29,12 @@ COMPILATION_DIR = None
 
 LIBRARY_DIR = None
 
+# Names of the work libraries (TEST_<n>) already present in LIBRARY_DIR.
+EXISTING_LIBRARIES = set()
+
+# Test type the directories above were last set up for.
+DIRECTORY_TYPE = None
+
 # Test mapping for subdirectories and file ranges.
 TEST_MAPPING = {
     "simple": range(0, 2),
@@ -31,8 +45,93 @@ TEST_MAPPING = {
     }
 }
 
-# Stores the add wave command for a range of tests for better performance.
-_wave_command_cache = {}
+
+def flatten_test_mapping(type):
+    """
+    Flatten TEST_MAPPING into the tests of one test type.
+
+    Args:
+        type (str): Test type, "m" for main or "e" for extra.
+
+    Returns:
+        tuple: A tuple of (subdirectory, test number) pairs, in the order of TEST_MAPPING.
+    """
+    subdir = "main" if type == "m" else "extra"
+    tests = []
+    for directory, test_range in TEST_MAPPING.items():
+        if isinstance(test_range, dict):  # Handle subdirectories for "logic"
+            if subdir in test_range:
+                tests.extend((f"{directory}/{subdir}", i) for i in test_range[subdir])
+        else:  # Simple directories like "simple" or "move"
+            tests.extend((directory, i) for i in test_range)
+    return tuple(tests)
+
+
+# The tests of each test type, flattened once so test collection does not walk TEST_MAPPING.
+FLAT_TESTS = {type: flatten_test_mapping(type) for type in ("m", "e")}
+
+# Knight move offsets (dx, dy), in the order the tour logic tries them.
+KNIGHT_MOVES = (
+    (1, 2), (-1, 2),
+    (-2, 1), (-2, -1),
+    (-1, -2), (1, -2),
+    (2, -1), (2, 1)
+)
+
+# Pattern for the Knight's Tour start position and board coordinates in a transcript, telling them
+# apart by whether the "start" group matched.
+_RE_TOUR = re.compile(
+    rb'(?:(?P<start>KnightsTour starting at coordinate:)|Coordinate on the board:)[ \t]*\((?P<x>\d+),[ \t]*(?P<y>\d+)\)'
+)
+
+# Default waveform signals for each group of tests.
+_SIGNALS_TEST0 = (
+    "iDUT/clk", "iDUT/RST_n", "iDUT/TX", "iDUT/RX", "iRMT/resp", "iRMT/resp_rdy"
+)
+
+_SIGNALS_TEST1 = (
+    "iDUT/clk", "iDUT/RST_n", "iDUT/cal_done", "iPHYS/iNEMO/NEMO_setup", "iDUT/iTC/send_resp", "iRMT/resp", "iRMT/resp_rdy"
+)
+
+_SIGNALS_MOVE = (
+    "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
+    "iPHYS/cntrIR_n", "iDUT/iCMD/lftIR", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs",
+    "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
+    "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state"
+)
+
+_SIGNALS_LOGIC_MAIN = (
+    "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
+    "iDUT/iCMD/lftIR", "iPHYS/cntrIR_n", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs",
+    "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
+    "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state",
+    "iDUT/iCMD/tour_go", "iDUT/iTL/done", "iDUT/fanfare_go", "iDUT/ISPNG/state"
+)
+
+_SIGNALS_LOGIC_EXTRA = (
+    "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
+    "iDUT/iCMD/lftIR", "iPHYS/cntrIR_n", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs", "iDUT/iCMD/y_pos", "iDUT/y_offset", 
+    "iDUT/iCMD/came_back", "iDUT/iCMD/off_board", "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
+    "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state",
+    "iDUT/iCMD/tour_go", "iDUT/iTL/done", "iDUT/fanfare_go", "iDUT/ISPNG/state"
+)
+
+# Names of the debugging modes that run the tests (0-2), as printed in the mode message.
+_MODE_NAMES = ("command-line", "saving", "GUI")
+
+# Process pool shared by all parallel work of each process, keyed by process ID (see get_pool).
+_POOLS = {}
+
+# Start pool workers with fork on Linux, whatever the default start method is, so they inherit the
+# imported modules and warmed-up state of the parent instead of starting a new interpreter.
+_FORK_WORKERS = sys.platform.startswith("linux")
+
+# The add wave command for each group of tests, built once at import.
+_WAVE_CMD_T0 = " ".join(f"add wave {signal};" for signal in _SIGNALS_TEST0)
+_WAVE_CMD_T1 = " ".join(f"add wave {signal};" for signal in _SIGNALS_TEST1)
+_WAVE_CMD_2_14 = " ".join(f"add wave {signal};" for signal in _SIGNALS_MOVE)
+_WAVE_CMD_15PLUS_MAIN = " ".join(f"add wave {signal};" for signal in _SIGNALS_LOGIC_MAIN)
+_WAVE_CMD_15PLUS_EXTRA = " ".join(f"add wave {signal};" for signal in _SIGNALS_LOGIC_EXTRA)
 
 def parse_arguments():
     """Parse and validate command-line arguments.
@@ -61,12 +160,20 @@ def parse_arguments():
     parser.add_argument("-t", "--type", type=str, choices=["m", "e", "a"], default="a",
                         help="Specify the type of tests to run the simulation: 'main', 'extra', 'all. Default is 'all'.")
     
+    # Argument for limiting the number of tests run in parallel.
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Maximum number of tests to simulate in parallel, shared between main and extra tests. Default is the number of CPUs. "
+                             "Ignored in GUI mode (-m 2), which opens a window for every test at once.")
+
     # Argument to know if the current process is a child process or a parent process.
     parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
         
     # Parse the arguments from the command line.
     args = parser.parse_args()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
     return args
 
 
@@ -75,7 +182,7 @@ def setup_directories(type):
 
     This function creates all required directories (logs, transcripts, compilation,
     waveform output, and the library). If the directories already exist, they are
-    not recreated.
+    not recreated. Calls for the type that is already set up return right away.
 
     Args: 
         type (str): The type of test file to be run (main/extra).
@@ -84,7 +191,12 @@ def setup_directories(type):
         None
     """
     # Modifying the TYPE_DIR variable declared above.
-    global OUTPUT_DIR, WAVES_DIR, LOGS_DIR, TRANSCRIPT_DIR, COMPILATION_DIR, LIBRARY_DIR
+    global OUTPUT_DIR, WAVES_DIR, LOGS_DIR, TRANSCRIPT_DIR, COMPILATION_DIR, LIBRARY_DIR, EXISTING_LIBRARIES, DIRECTORY_TYPE
+
+    # Nothing to do if this process already set up the directories for this type.
+    if type == DIRECTORY_TYPE:
+        return
+    DIRECTORY_TYPE = type
 
     # Update TYPE_DIR based on the test type.
     if type == "e":
@@ -100,18 +212,28 @@ def setup_directories(type):
     COMPILATION_DIR = os.path.join(LOGS_DIR, "compilation")
     LIBRARY_DIR = os.path.join(TYPE_DIR, "TESTS")
 
-    # Ensure all required directories exist.
-    directories = [TYPE_DIR, OUTPUT_DIR, WAVES_DIR, LOGS_DIR, TRANSCRIPT_DIR, COMPILATION_DIR, LIBRARY_DIR]
+    # Ensure all required directories exist, skipping the ones from a previous run. Only the leaf
+    # directories are listed, since os.makedirs creates TYPE_DIR, OUTPUT_DIR and LOGS_DIR along the way.
+    directories = [TRANSCRIPT_DIR, COMPILATION_DIR, WAVES_DIR, LIBRARY_DIR]
     for directory in directories:
+        if os.path.isdir(directory):
+            continue
         try:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory, exist_ok=True)
         except OSError as e:
             print(f"Creating the required directories failed with error: {e}")
 
+    # Scan the library directory once to find the work libraries that were already created.
+    try:
+        with os.scandir(LIBRARY_DIR) as entries:
+            EXISTING_LIBRARIES = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        EXISTING_LIBRARIES = set()
+
 
 def get_wave_command(test_num, test_type):
     """
-    Generate the command for waveform signals based on the test number and type.
+    Get the command for waveform signals based on the test number and type.
 
     Args:
         test_num (int): The test number to determine the required signals.
@@ -120,57 +242,199 @@ def get_wave_command(test_num, test_type):
     Returns:
         str: A string containing the waveform command for the selected signals.
     """
-    # Define a unique cache key based on test range and type.
+    # Select the precomputed command based on the test range and type.
     if test_num == 0:
-        key = (0, test_type)
-        default_signals = [
-            "iDUT/clk", "iDUT/RST_n", "iDUT/TX", "iDUT/RX", "iRMT/resp", "iRMT/resp_rdy"
-        ]
+        return _WAVE_CMD_T0
     elif test_num == 1:
-        key = (1, test_type)
-        default_signals = [
-            "iDUT/clk", "iDUT/RST_n", "iDUT/cal_done", "iPHYS/iNEMO/NEMO_setup", "iDUT/iTC/send_resp", "iRMT/resp", "iRMT/resp_rdy"
-        ]
-    elif 2 <= test_num <= 14:
-        key = ((2, 14), test_type)
-        default_signals = [
-            "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
-            "iPHYS/cntrIR_n", "iDUT/iCMD/lftIR", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs",
-            "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
-            "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state"
-        ]
-    else:  # test_num >= 15
-        key = ((15, float('inf')), test_type)
-        if test_type == "m":
-            default_signals = [
-                "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
-                "iDUT/iCMD/lftIR", "iPHYS/cntrIR_n", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs",
-                "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
-                "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state",
-                "iDUT/iCMD/tour_go", "iDUT/iTL/done", "iDUT/fanfare_go", "iDUT/ISPNG/state"
-            ]
-        elif test_type == "e":
-            default_signals = [
-                "iDUT/clk", "iDUT/RST_n", "iPHYS/xx", "iPHYS/yy", "iDUT/iNEMO/heading", "iPHYS/heading_robot", "iDUT/iCMD/desired_heading", "iPHYS/omega_sum",
-                "iDUT/iCMD/lftIR", "iPHYS/cntrIR_n", "iDUT/iCMD/cntrIR", "iDUT/iCMD/rghtIR", "iDUT/iCMD/error_abs", "iDUT/iCMD/y_pos", "iDUT/y_offset", 
-                "iDUT/iCMD/came_back", "iDUT/iCMD/off_board", "iDUT/iCMD/square_cnt", "iDUT/iCMD/move_done", "iDUT/iTC/state", "iDUT/iTC/send_resp", "iRMT/resp",
-                "iRMT/resp_rdy", "iDUT/iTC/mv_indx", "iDUT/iTC/move", "iDUT/iCMD/pulse_cnt", "iDUT/iCMD/state",
-                "iDUT/iCMD/tour_go", "iDUT/iTL/done", "iDUT/fanfare_go", "iDUT/ISPNG/state"
-            ]
-
-    # Check if the result for this range and type is cached.
-    if key in _wave_command_cache:
-        wave_command = _wave_command_cache[key]
+        return _WAVE_CMD_T1
+    elif test_num < 15:
+        return _WAVE_CMD_2_14
     else:
-        # Cache the wave command if it doesn't exist.
-        wave_command = " ".join([f"add wave {signal};" for signal in default_signals])
-        _wave_command_cache[key] = wave_command
+        return _WAVE_CMD_15PLUS_MAIN if test_type == "m" else _WAVE_CMD_15PLUS_EXTRA
+
+
+@functools.lru_cache(maxsize=None)
+def get_legal_moves(rows, cols):
+    """
+    Precomputes the Knight's legal moves from every square of the board.
+
+    Squares are numbered by index x * cols + y. The moves from each square are kept in the 
+    order of KNIGHT_MOVES.
+
+    Args:
+        rows (int): Number of rows on the chessboard.
+        cols (int): Number of columns on the chessboard.
+
+    Returns:
+        tuple: A tuple indexed by square index, holding a tuple of the square indices 
+               reachable from that square.
+    """
+    return tuple(
+        tuple(
+            (x + dx) * cols + (y + dy)
+            for dx, dy in KNIGHT_MOVES
+            if 0 <= x + dx < rows and 0 <= y + dy < cols
+        )
+        for x in range(rows)
+        for y in range(cols)
+    )
 
-    # Return the cached or newly generated waveform command.
-    return wave_command
+
+def search_knights_tour(start, moves, move_counts):
+    """
+    Depth-first search for a Knight's Tour over square indices, compiled by get_compiled_search.
+
+    Args:
+        start (int): Index of the starting square.
+        moves (ndarray): Legal move table, row i holds the squares reachable from square i.
+        move_counts (ndarray): Number of legal moves from each square.
+
+    Returns:
+        ndarray: The square indices of the tour, or an empty array if no tour exists.
+    """
+    num_squares = move_counts.shape[0]
+    path = np.empty(num_squares, np.int64)
+    next_move = np.zeros(num_squares, np.int64)
+    path[0] = start
+    visited = np.int64(1) << start
+    depth = 0
+
+    while depth >= 0:
+        if depth == num_squares - 1:
+            return path
+
+        square = path[depth]
+        if next_move[depth] == move_counts[square]:
+            # No moves left from this square, back up to the previous one.
+            visited &= ~(np.int64(1) << square)
+            depth -= 1
+            continue
+
+        target = moves[square, next_move[depth]]
+        next_move[depth] += 1
+        if not visited & (np.int64(1) << target):
+            visited |= np.int64(1) << target
+            depth += 1
+            path[depth] = target
+            next_move[depth] = 0
+
+    return path[:0]
+
+
+@functools.lru_cache(maxsize=None)
+def get_compiled_search():
+    """
+    Imports Numba and compiles search_knights_tour the first time a tour is computed.
+
+    Numba and NumPy are only imported by the processes that validate a tour, so the main process 
+    and the workers forked from it stay lean.
+
+    Returns:
+        callable: The compiled search, or None if Numba is not installed.
+    """
+    global np
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(search_knights_tour)
+
+
+@functools.lru_cache(maxsize=None)
+def get_legal_move_arrays(rows, cols):
+    """
+    Packs the legal move table into arrays for the compiled search.
+
+    Args:
+        rows (int): Number of rows on the chessboard.
+        cols (int): Number of columns on the chessboard.
+
+    Returns:
+        tuple: The (moves, move_counts) arrays expected by search_knights_tour.
+    """
+    legal_moves = get_legal_moves(rows, cols)
+    moves = np.full((len(legal_moves), len(KNIGHT_MOVES)), -1, np.int64)
+    for square, targets in enumerate(legal_moves):
+        moves[square, :len(targets)] = targets
+    return moves, np.array([len(targets) for targets in legal_moves], np.int64)
 
 
-def validate_solution(log_file):
+@functools.lru_cache(maxsize=None)
+def compute_knights_tour(start_position, rows=5, cols=5):
+    """
+    Computes the Knight's Tour solution starting from the given position.
+
+    This uses an iterative depth-first search (DFS) algorithm to find a valid Knight's Tour.
+    Results are cached by start position, so each start is only solved once per process.
+
+    Args:
+        start_position (tuple): Starting position (x, y) of the Knight.
+        rows (int): Number of rows on the chessboard. Default is 5.
+        cols (int): Number of columns on the chessboard. Default is 5.
+
+    Returns:
+        tuple: A tuple of coordinates representing the Knight's Tour, or None if no 
+               valid Knight's Tour solution exists from the starting position.
+    """
+    num_squares = rows * cols
+
+    # Use the compiled search when Numba is available and the board fits in a 64-bit mask.
+    search = get_compiled_search() if num_squares < 64 else None
+    if search is not None:
+        moves, move_counts = get_legal_move_arrays(rows, cols)
+        path = search(start_position[0] * cols + start_position[1], moves, move_counts)
+        return tuple(divmod(int(square), cols) for square in path) if len(path) else None
+
+    legal_moves = get_legal_moves(rows, cols)
+
+    # Depth-first search with an explicit stack holding the remaining moves to try from each 
+    # square on the current path. Moves are tried in the fixed order of KNIGHT_MOVES. Squares 
+    # are handled by index, and the visited squares are kept as bits of a single int.
+    square = start_position[0] * cols + start_position[1]
+    visited = 1 << square
+    solution_path = [square]
+    stack = [iter(legal_moves[square])]
+
+    while stack:
+        if len(solution_path) == num_squares:
+            return tuple(divmod(square, cols) for square in solution_path)
+
+        for square in stack[-1]:
+            if not visited & (1 << square):
+                break
+        else:
+            # No moves left from this square, back up to the previous one.
+            stack.pop()
+            visited &= ~(1 << solution_path.pop())
+            continue
+
+        visited |= 1 << square
+        solution_path.append(square)
+        stack.append(iter(legal_moves[square]))
+
+    return None
+
+
+@contextlib.contextmanager
+def open_log(log_file):
+    """Memory-map a log file so it can be searched without decoding it into a string.
+
+    Args:
+        log_file (str): Path to the log file.
+
+    Yields:
+        mmap.mmap or bytes: The content of the log file (empty bytes for an empty file, which cannot be mapped).
+    """
+    with open(log_file, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+
+
+def validate_solution(log_file, content=None):
     """
     Validates if the log file coordinates match the computed Knight's Tour solution.
 
@@ -180,6 +444,8 @@ def validate_solution(log_file):
 
     Args:
         log_file (str): Path to the log file containing the Knight's Tour data.
+        content (mmap.mmap or bytes, optional): Content of the log file, if it is already open. 
+                                                The log file is only read when this is None.
 
     Raises:
         SystemExit: If validation fails, the program exits with an error.
@@ -188,7 +454,7 @@ def validate_solution(log_file):
         str: "success" if the log file coordinates match the computed solution, 
              "error" otherwise.
     """
-    def extract_data_from_log(file_path):
+    def extract_data_from_log(content):
         """
         Extracts the starting position and sequence of coordinates from the log file.
 
@@ -199,7 +465,7 @@ def validate_solution(log_file):
           "Coordinate on the board: (x, y)"
 
         Args:
-            file_path (str): Path to the log file.
+            content (mmap.mmap or bytes): Content of the log file.
 
         Returns:
             tuple: A tuple containing:
@@ -209,24 +475,16 @@ def validate_solution(log_file):
         Raises:
             ValueError: If the starting position or coordinates are not found in the log file.
         """
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-
         start_position = None
         coordinates = []
 
-        for line in lines:
-            # Extract the starting position
-            if "KnightsTour starting at coordinate:" in line:
-                match = re.search(r'\((\d+),\s*(\d+)\)', line)
-                if match:
-                    start_position = (int(match.group(1)), int(match.group(2)))
-
-            # Extract each coordinate on the board
-            elif "Coordinate on the board:" in line:
-                match = re.search(r'\((\d+),\s*(\d+)\)', line)
-                if match:
-                    coordinates.append((int(match.group(1)), int(match.group(2))))
+        # Scan the whole log in a single pass over its memory-mapped bytes.
+        for match in _RE_TOUR.finditer(content):
+            position = (int(match.group("x")), int(match.group("y")))
+            if match.group("start"):
+                start_position = position
+            else:
+                coordinates.append(position)
 
         if start_position is None:
             raise ValueError("Starting position not found in the log file.")
@@ -236,92 +494,24 @@ def validate_solution(log_file):
 
         return start_position, coordinates
 
-    def compute_knights_tour(start_position, rows=5, cols=5):
-        """
-        Computes the Knight's Tour solution starting from the given position.
-
-        This uses a depth-first search (DFS) algorithm to find a valid Knight's Tour.
-
-        Args:
-            start_position (tuple): Starting position (x, y) of the Knight.
-            rows (int): Number of rows on the chessboard. Default is 5.
-            cols (int): Number of columns on the chessboard. Default is 5.
-
-        Returns:
-            list: A list of coordinates representing the Knight's Tour.
-
-        Raises:
-            ValueError: If no valid Knight's Tour solution exists from the starting position.
-        """
-        visited_squares = [[0 for _ in range(cols)] for _ in range(rows)]
-        solution_path = []
-
-        def get_valid_moves(square):
-            """
-            Returns all valid moves from a given square.
-
-            Args:
-                square (tuple): Current position (x, y) of the Knight.
-
-            Returns:
-                list: A list of valid moves (x, y).
-            """
-            x, y = square
-            moves = [
-                (x + 1, y + 2), (x - 1, y + 2),
-                (x - 2, y + 1), (x - 2, y - 1),
-                (x - 1, y - 2), (x + 1, y - 2),
-                (x + 2, y - 1), (x + 2, y + 1)
-            ]
-            return [
-                (nx, ny)
-                for nx, ny in moves
-                if 0 <= nx < rows and 0 <= ny < cols and not visited_squares[nx][ny]
-            ]
-
-        def dfs(square, move_count=1):
-            """
-            Performs depth-first search to find a valid Knight's Tour.
-
-            Args:
-                square (tuple): Current position (x, y) of the Knight.
-                move_count (int): Current move count. Default is 1.
-
-            Returns:
-                bool: True if a valid solution is found, False otherwise.
-            """
-            x, y = square
-            visited_squares[x][y] = 1
-            solution_path.append(square)
-
-            if move_count == rows * cols:
-                return True
-
-            for move in get_valid_moves(square):
-                if dfs(move, move_count + 1):
-                    return True
-
-            visited_squares[x][y] = 0
-            solution_path.pop()
-            return False
-
-        if not dfs(start_position):
-            raise ValueError("No valid Knight's Tour solution exists from the starting position.")
-
-        return solution_path
-
     try:
         # Extract the starting position and Knight's Tour coordinates from the log file.
-        start_position, log_coordinates = extract_data_from_log(log_file)
+        if content is None:
+            with open_log(log_file) as content:
+                start_position, log_coordinates = extract_data_from_log(content)
+        else:
+            start_position, log_coordinates = extract_data_from_log(content)
 
         # Compute the solution for the Knight's Tour starting at the given position.
         computed_solution = compute_knights_tour(start_position)
+        if computed_solution is None:
+            raise ValueError("No valid Knight's Tour solution exists from the starting position.")
 
         # Trim the starting position from the computed solution for comparison.
         computed_solution_trimmed = computed_solution[1:]
 
         # Compare the computed solution with the coordinates from the log file.
-        if log_coordinates == computed_solution_trimmed:
+        if tuple(log_coordinates) == computed_solution_trimmed:
             return "success"
         else:
             return "error"
@@ -350,14 +540,11 @@ def check_logs(test_num, logfile, mode):
         Returns:
             str: Returns "error" if any errors are found, "warning" if warnings are present, or "success" if no issues are found.
         """
-        # Open and read the content of the log file
-        with open(log_file, "r") as file:
-            content = file.read()
-
-            # Check for the presence of "Error:" or "Warning:"
-            if "Error:" in content:
+        # Check for the presence of "Error:" or "Warning:", only scanning for warnings if there are no errors.
+        with open_log(log_file) as content:
+            if content.find(b"Error:") != -1:
                 return "error"
-            elif "Warning:" in content:
+            elif content.find(b"Warning:") != -1:
                 return "warning"
             else:
                 return "success"
@@ -372,23 +559,19 @@ def check_logs(test_num, logfile, mode):
         Returns:
             str: Returns "success" if the test passed, "error" if there was an error, or "unknown" if the status is not determined.
         """
-        # Open and read the content of the transcript log file.
-        with open(log_file, "r") as file:
-            content = file.read()
-
-            # Check for specific success or failure strings in the transcript.
-            if "ERROR" in content:
+        # Check for specific success or failure strings in the transcript. The scan stops at the first
+        # "ERROR", and a transcript that reports its own result is never validated. Later tests are only
+        # validated against the same mapping when neither string is present, so each transcript is only
+        # opened and read once.
+        with open_log(log_file) as content:
+            if content.find(b"ERROR") != -1:
                 return "error"
+            elif content.find(b"YAHOO!! All tests passed.") != -1:
+                return "success"
             elif test_num <= 15:
-                if "YAHOO!! All tests passed." in content:
-                    return "success"
-                else: 
-                    return "unknown"
+                return "unknown"
             else:
-                return validate_solution(log_file)
-                
-        # If no status is found, return unknown.
-        return "unknown"
+                return validate_solution(log_file, content)
 
     # Direct to the appropriate check function based on the mode
     if mode == "t":
@@ -397,13 +580,73 @@ def check_logs(test_num, logfile, mode):
         return check_compilation(logfile)
 
 
-def compile_files(test_num, test_path, type):
+@functools.lru_cache(maxsize=None)
+def collect_files(type):
+    """Collect the design and testbench support files compiled with every test.
+
+    The directories are only walked on the first call for each type, later calls
+    reuse the cached result.
+
+    Args:
+        type (str): The type of test file to be compiled (main/extra).
+
+    Returns:
+        tuple: A tuple containing:
+               - rtl_files (tuple): Files compiled with the RTL tests.
+               - netlist_files (tuple): Files compiled with the post-synthesis test (test 0).
+    """
+    pre_synthesis_dir = os.path.join(DESIGN_DIR, "pre_synthesis")
+    test_type = "main" if type == "m" else "extra"
+
+    def expand(*patterns):
+        """Expand each glob pattern in order, sorting its matches like the shell does."""
+        return tuple(path for pattern in patterns for path in sorted(glob.glob(pattern)))
+
+    rtl_files = expand(
+        os.path.join(pre_synthesis_dir, "*.sv"),
+        os.path.join(pre_synthesis_dir, test_type, "*.sv"),
+        os.path.join(TEST_DIR, "*.sv")
+    )
+    netlist_files = expand(
+        os.path.join(TEST_DIR, "*.sv"),
+        os.path.join(pre_synthesis_dir, "UART.sv"),
+        os.path.join(pre_synthesis_dir, "*_r*"),
+        os.path.join(pre_synthesis_dir, "*_tx*"),
+        os.path.join(DESIGN_DIR, "post_synthesis", "*.vg")
+    )
+    return rtl_files, netlist_files
+
+
+@functools.lru_cache(maxsize=None)
+def scan_test_directory(test_subdir):
+    """Find the test files in a test subdirectory that match the naming convention 'KnightsTour_tb_*.sv'.
+
+    Each subdirectory is only scanned on the first call, so the directories shared by the main and 
+    extra tests are not scanned again for the other type.
+
+    Args:
+        test_subdir (str): The test subdirectory, relative to the test directory.
+
+    Returns:
+        tuple: A tuple of tuples containing the subdirectory and the name of each test file.
+    """
+    with os.scandir(os.path.join(TEST_DIR, test_subdir)) as entries:
+        # DirEntry.is_file() uses the file type from the directory listing, so no extra stat is needed.
+        return tuple(
+            (test_subdir, entry.name)
+            for entry in entries
+            if entry.name.startswith("KnightsTour_tb") and entry.name.endswith(".sv") and entry.is_file()
+        )
+
+
+def compile_files(test_num, test_path, type, output=None):
     """Compile the required files for the test simulation.
 
     Args:
         test_num (int): The test number to identify the test for compilation.
         test_path (str): The path to the test file to be compiled.
         type (str): The type of test file to be compiled (main/extra).
+        output (io.StringIO, optional): Buffer for status messages. Defaults to None (stdout).
 
     Raises:
         SystemExit: If compilation fails, the program exits with an error.
@@ -412,23 +655,23 @@ def compile_files(test_num, test_path, type):
     log_file = os.path.join(COMPILATION_DIR, f"compilation_{test_num}.log")
 
     # Determine the files to compile based on the test number.
+    rtl_files, netlist_files = collect_files(type)
     if test_num != 0:
-        test_type = "main" if type == "m" else "extra"
-        all_files = f"../../designs/pre_synthesis/*.sv ../../designs/pre_synthesis/{test_type}/*.sv  ../../tests/*.sv {test_path}"
+        all_files = [*rtl_files, test_path]
     else:
-        all_files = f"-timescale=1ns/1ps ../../tests/*.sv ../../designs/pre_synthesis/UART.sv ../../designs/pre_synthesis/*_r* ../../designs/pre_synthesis/*_tx* ../../designs/post_synthesis/*.vg {test_path}"
+        all_files = ["-timescale=1ns/1ps", *netlist_files, test_path]
     
     # Attempt to compile the files.
     with open(log_file, 'w') as log_fh:
         try:            
-            # If the work library for that test does not exist we form a create library command with vlib.
-            if not Path(f"./TEST_{test_num}").is_dir():
-                compile_command = f"vsim -c -logfile {log_file} -do 'vlib TEST_{test_num}; vlog -work TEST_{test_num} -vopt -stats=none {all_files}; quit -f;'"
-            else:
-                compile_command = f"vlog -logfile {log_file} -work TEST_{test_num} -vopt -stats=none {all_files}"
-            subprocess.run(compile_command, shell=True, stdout=log_fh, stderr=subprocess.STDOUT, check=True)
+            # If the work library for that test does not exist we create it with vlib first. Both are
+            # standalone tools, so the simulator kernel is only started once per test, to simulate.
+            if f"TEST_{test_num}" not in EXISTING_LIBRARIES:
+                subprocess.run(["vlib", f"TEST_{test_num}"], stdout=log_fh, stderr=subprocess.STDOUT, check=True, cwd=LIBRARY_DIR)
+            compile_command = ["vlog", "-logfile", log_file, "-work", f"TEST_{test_num}", "-vopt", "-stats=none", *all_files]
+            subprocess.run(compile_command, stdout=log_fh, stderr=subprocess.STDOUT, check=True, cwd=LIBRARY_DIR)
         except subprocess.CalledProcessError:
-            print(f"Compilation failed for {test_path}. Run 'make log c {type} {test_num}' for details.")
+            print(f"Compilation failed for {test_path}. Run 'make log c {type} {test_num}' for details.", file=output)
             sys.exit(1)  # Exit the program if compilation fails.
 
     # Check if the compilation was successful or not.
@@ -436,9 +679,9 @@ def compile_files(test_num, test_path, type):
 
     # Provide feedback on the compilation result.
     if result == "warning":
-        print(f"Compilation has warnings for {test_path}. Run 'make log c {type} {test_num}' for details.")
+        print(f"Compilation has warnings for {test_path}. Run 'make log c {type} {test_num}' for details.", file=output)
     elif result == "error":
-        print(f"Compilation failed for {test_path}. Run 'make log c {type} {test_num}' for details.")
+        print(f"Compilation failed for {test_path}. Run 'make log c {type} {test_num}' for details.", file=output)
         sys.exit(1)  # Exit the program if compilation fails.
 
 
@@ -452,7 +695,7 @@ def get_gui_command(test_num, log_file, args):
         args (argparse.Namespace): Parsed command-line arguments, including mode and test-specific settings.
 
     Returns:
-        str: The complete simulation command string to execute for GUI mode.
+        list: The complete simulation command, as an argument list, to execute for GUI mode.
     """
     wave_file = os.path.join(WAVES_DIR, f"KnightsTour_tb_{test_num}.wlf")
     wave_format_file = os.path.join(WAVES_DIR, f"KnightsTour_tb_{test_num}.do")
@@ -461,24 +704,19 @@ def get_gui_command(test_num, log_file, args):
     add_wave_command = get_wave_command(test_num, args.type)
 
     # Construct the simulation command with necessary flags for waveform generation.
+    sim_command = ["vsim", "-wlf", wave_file, f"TEST_{test_num}.KnightsTour_tb", "-logfile", log_file]
     if test_num == 0:
-        sim_command = (
-            f"vsim -wlf {wave_file} TEST_{test_num}.KnightsTour_tb -logfile {log_file} -t ns "
-            f"-Lf {CELL_LIBRARY_PATH} -voptargs='+acc' -do '{add_wave_command} run -all; "
-            f"write format wave -window .main_pane.wave.interior.cs.body.pw.wf {wave_format_file}; "
-            f"log -flush /*;'"
-        )
-    else:
-        sim_command = (
-            f"vsim -wlf {wave_file} TEST_{test_num}.KnightsTour_tb -logfile {log_file} -voptargs='+acc' -do '{add_wave_command} run -all; "
-            f"write format wave -window .main_pane.wave.interior.cs.body.pw.wf {wave_format_file}; log -flush /*;'"
-        )
+        sim_command += ["-t", "ns", "-Lf", CELL_LIBRARY_PATH]
+    do_script = (
+        f"{add_wave_command} run -all; "
+        f"write format wave -window .main_pane.wave.interior.cs.body.pw.wf {wave_format_file}; log -flush /*;"
+    )
 
     # Adjust for mode 0 or 1 to ensure the simulation quits after completion.
     if args.mode == 0 or args.mode == 1:
-        sim_command = sim_command[:-1] + " quit -f;'"
+        do_script += " quit -f;"
 
-    return sim_command
+    return sim_command + ["-voptargs=+acc", "-do", do_script]
 
 
 def run_simulation(test_num, test_name, log_file, args):
@@ -497,13 +735,14 @@ def run_simulation(test_num, test_name, log_file, args):
         if args.number is not None and args.range is None:
             print(f"{test_name}: Running in command-line mode...")
 
-        # Base simulation command.
-        sim_command = f"vsim -c TEST_{test_num}.KnightsTour_tb -logfile {log_file} -do 'run -all; log -flush /*; quit -f;'"
+        # Base simulation command. The waveform log is not flushed here since it is never viewed
+        # in command-line mode; failing tests are re-run through get_gui_command, which flushes it.
+        sim_command = ["vsim", "-c", f"TEST_{test_num}.KnightsTour_tb", "-logfile", log_file]
         
         # Modify the command for test 0.
         if test_num == 0:
-            sim_command = f"vsim -c TEST_0.KnightsTour_tb -logfile {log_file} -t ns " \
-                    f"-Lf {CELL_LIBRARY_PATH} -do 'run -all; log -flush /*; quit -f;'"        
+            sim_command += ["-t", "ns", "-Lf", CELL_LIBRARY_PATH]
+        sim_command += ["-do", "run -all; quit -f;"]
     else:
         if args.mode == 1: # Save waveforms and log in file.
             if args.number is not None and args.range is None:
@@ -516,34 +755,34 @@ def run_simulation(test_num, test_name, log_file, args):
 
     # Execute the simulation command and log the output.
     with open(log_file, 'w') as log_fh:
-        subprocess.run(sim_command, shell=True, stdout=log_fh, stderr=subprocess.STDOUT, check=True)
+        subprocess.run(sim_command, stdout=log_fh, stderr=subprocess.STDOUT, check=True, cwd=LIBRARY_DIR)
 
     # Check simulation result and return status.
     return check_logs(test_num, log_file, "t")
 
 
-def run_test(subdir, test_file, args):
-    """Run a specific testbench by compiling and executing the simulation.
+def compile_test(subdir, test_file, args, output=None):
+    """Compile a specific testbench ahead of its simulation.
 
     Args:
         subdir (str): The subdirectory where the test file is located.
-        test_file (str): The test file to be compiled and executed.
+        test_file (str): The test file to be compiled.
         args (argparse.Namespace): Parsed command-line arguments, including mode and test-specific settings.
+        output (io.StringIO, optional): Buffer for status messages. Defaults to None (stdout).
 
     Returns:
-        None: This function prints status messages based on the test result.
+        tuple: A tuple containing the test number, test name, and transcript log file needed to simulate the test.
     """
     # Determine the full path to the test file.
     test_path = os.path.join(TEST_DIR, subdir, test_file)
     test_name = os.path.splitext(test_file)[0]
     log_file = os.path.join(TRANSCRIPT_DIR, f"{test_name}.log")
-    os.chdir(LIBRARY_DIR)
 
     # Extract the test number from the test name (if it exists).
     test_num = int(re.search(r'\d+', test_name).group()) if re.search(r'\d+', test_name) else None
 
-    # Step 1: Compile the testbench.
-    compile_files(test_num, test_path, args.type)
+    # Compile the testbench.
+    compile_files(test_num, test_path, args.type, output)
 
     # Append main/extra to the name based on the type only when all tests are being run.
     if args.child:
@@ -552,37 +791,164 @@ def run_test(subdir, test_file, args):
         elif args.type == "e":
             test_name += "_extra"
 
-    # Step 2: Run the simulation and handle different modes.
+    return test_num, test_name, log_file
+
+
+def simulate_test(test_num, test_name, log_file, args, output=None):
+    """Simulate a compiled testbench and report its result.
+
+    Args:
+        test_num (int): The test number to identify the specific test.
+        test_name (str): The name of the test (used for logging and messages).
+        log_file (str): Path to the log file where simulation output will be saved.
+        args (argparse.Namespace): Parsed command-line arguments, including mode and test-specific settings.
+        output (io.StringIO, optional): Buffer for status messages. Defaults to None (stdout).
+
+    Returns:
+        None: This function prints status messages based on the test result.
+    """
+    # Run the simulation and handle different modes.
     result = run_simulation(test_num, test_name, log_file, args)
     
     # Output the result of the test based on the simulation result.
     if result == "success":
-        print(f"{test_name}: YAHOO!! All tests passed.")
+        print(f"{test_name}: YAHOO!! All tests passed.", file=output)
     elif result == "error":
         if args.mode == 0:
-            print(f"{test_name}: Test failed. Run 'make log t {args.type} {test_num}' for details. Saving waveforms for later debug...")
+            print(f"{test_name}: Test failed. Run 'make log t {args.type} {test_num}' for details. Saving waveforms for later debug...", file=output)
             debug_command = get_gui_command(test_num, log_file, args)
             with open(log_file, 'w') as log_fh:
-                subprocess.run(debug_command, shell=True, stdout=log_fh, stderr=subprocess.STDOUT, check=True)
+                subprocess.run(debug_command, stdout=log_fh, stderr=subprocess.STDOUT, check=True, cwd=LIBRARY_DIR)
         elif args.mode == 1:
-            print(f"{test_name}: Test failed. Run 'make log t {args.type} {test_num}' for details.")
+            print(f"{test_name}: Test failed. Run 'make log t {args.type} {test_num}' for details.", file=output)
     elif result == "unknown":
-        print(f"{test_name}: Unknown status. Run 'make log t {args.type} {test_num}' for details.")
+        print(f"{test_name}: Unknown status. Run 'make log t {args.type} {test_num}' for details.", file=output)
+
+
+def run_stage(type, stage, *stage_args):
+    """Run one stage of a test in a worker process and capture the messages it prints.
+
+    Args:
+        type (str): The type of the test (main/extra), to set up the directories of the worker.
+        stage (callable): The stage to run, either compile_test or simulate_test.
+        *stage_args: Positional arguments passed on to the stage.
+
+    Returns:
+        tuple: A tuple containing:
+               - result: The return value of the stage (None if it exited).
+               - messages (str): The status messages printed by the stage.
+               - exit_code: The exit code if the stage called sys.exit, None otherwise.
+    """
+    setup_directories(type)
+    output = io.StringIO()
+    try:
+        return stage(*stage_args, output), output.getvalue(), None
+    except SystemExit as e:
+        return None, output.getvalue(), e.code
+
+
+def init_worker(type=None):
+    """Warm up the state a worker process needs for the tests of a type, once when it starts.
+
+    Sets up the directories and collects the files compiled with every test, so the tasks of the
+    worker find them cached. A worker forked after its parent warmed up inherits this state.
+
+    Args:
+        type (str, optional): The type of the tests the worker runs (main/extra). Nothing is warmed 
+                              up when None.
+
+    Returns:
+        None
+    """
+    if type is not None:
+        setup_directories(type)
+        collect_files(type)
+
+
+def get_pool(max_workers=None, type=None):
+    """Get the process pool shared by all parallel work in this process.
+
+    The pool is created on the first call and reused afterwards, so the worker processes are only
+    started once per run. It is shut down when the script exits. Pools are kept per process ID, so a
+    forked worker creates its own pool instead of using the copy of its parent's.
+
+    Args:
+        max_workers (int, optional): Number of worker processes, only used when the pool is created. 
+                                     Defaults to the number of CPUs.
+        type (str, optional): The type of the tests the workers run, warmed up by init_worker when 
+                              the pool is created.
+
+    Returns:
+        ProcessPoolExecutor: The process pool of this process.
+    """
+    pool = _POOLS.get(os.getpid())
+    if pool is None:
+        # The pool machinery is only imported once a pool is needed, runs of a single test never use it.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Warm up here first, so forked workers inherit the state instead of each rebuilding it.
+        init_worker(type)
+        mp_context = multiprocessing.get_context("fork") if _FORK_WORKERS else None
+        pool = _POOLS[os.getpid()] = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=init_worker, initargs=(type,)
+        )
+        atexit.register(shutdown_pool)
+    return pool
+
+
+def shutdown_pool():
+    """Shut down the process pool of this process, if it has one, waiting for its workers to exit.
+
+    Returns:
+        None
+    """
+    pool = _POOLS.pop(os.getpid(), None)
+    if pool is not None:
+        pool.shutdown()
+
+
+def write_output(messages):
+    """Write the buffered messages of a test to stdout in a single call.
+
+    Args:
+        messages (str): The status messages of a test.
+
+    Returns:
+        None
+    """
+    sys.stdout.write(messages)
+    sys.stdout.flush()
+
+
+def run_test(subdir, test_file, args):
+    """Run a specific testbench by compiling and executing the simulation.
+
+    Args:
+        subdir (str): The subdirectory where the test file is located.
+        test_file (str): The test file to be compiled and executed.
+        args (argparse.Namespace): Parsed command-line arguments, including mode and test-specific settings.
+
+    Returns:
+        None: This function prints status messages based on the test result.
+    """
+    # Step 1: Compile the testbench.
+    test_num, test_name, log_file = compile_test(subdir, test_file, args)
+
+    # Step 2: Run the simulation and output the result.
+    simulate_test(test_num, test_name, log_file, args)
 
 
 def view_waveforms(test_number, args):
-    """View previously saved waveforms for a specific test.
+    """Start viewing previously saved waveforms for a specific test.
 
     Args:
         test_number (int): The test number to view waveforms for.
         args (argparse.Namespace): Parsed command-line arguments, including mode and test-specific settings.
 
     Returns:
-        None: This function executes the simulation command to view waveforms.
+        subprocess.Popen: The running waveform viewer, which the caller waits on.
     """
-    # Change to the wave directory and view the saved waveforms.    
-    os.chdir(WAVES_DIR)
-
     # Get the test name of the specific test based on its number.
     test_name = f"KnightsTour_tb_{test_number}"
     
@@ -590,12 +956,12 @@ def view_waveforms(test_number, args):
     if args.child:
         test_name += "_main" if args.type == "m" else "_extra"
 
-    # View the waves.
-    with open(f"./transcript_{test_number}", 'w') as transcript:
+    # View the waves, running the viewer from the wave directory.
+    with open(os.path.join(WAVES_DIR, f"transcript_{test_number}"), 'w') as transcript:
         if args.number is not None and args.range is None:
             print(f"{test_name}: Viewing saved waveforms...")
-        sim_command = f"vsim -view KnightsTour_tb_{test_number}.wlf -do KnightsTour_tb_{test_number}.do;"
-        subprocess.run(sim_command, shell=True, stdout=transcript, stderr=subprocess.STDOUT, check=True)
+        sim_command = ["vsim", "-view", f"KnightsTour_tb_{test_number}.wlf", "-do", f"KnightsTour_tb_{test_number}.do"]
+        return subprocess.Popen(sim_command, stdout=transcript, stderr=subprocess.STDOUT, cwd=WAVES_DIR)
 
 
 def execute_tests(args):
@@ -619,15 +985,7 @@ def execute_tests(args):
         Returns:
             list: A list of test numbers for the specified subdirectory.
         """
-        all_tests = []
-        for directory, test_range in TEST_MAPPING.items():
-            if isinstance(test_range, dict):  # Handle subdirectories for "logic"
-                subdir = "main" if args.type == "m" else "extra"
-                if subdir in test_range:
-                    all_tests.extend(test_range[subdir])
-            else:  # Simple directories like "simple" or "move"
-                all_tests.extend(test_range)
-        return all_tests
+        return [test_num for _, test_num in FLAT_TESTS[args.type]]
 
     def get_tests_in_range(start, end):
         """
@@ -640,21 +998,10 @@ def execute_tests(args):
         Returns:
             list: A list of tuples containing the subdirectory and test file for each test in the range.
         """
-        result = []
-        for directory, test_range in TEST_MAPPING.items():
-            if isinstance(test_range, dict):  # Handle subdirectories for "logic"
-                subdir = "main" if args.type == "m" else "extra"
-                if subdir in test_range:
-                    result.extend(
-                        (f"{directory}/{subdir}", f"KnightsTour_tb_{i}.sv")
-                        for i in test_range[subdir] if start <= i <= end
-                    )
-            else:  # Simple directories like "simple" or "move"
-                result.extend(
-                    (directory, f"KnightsTour_tb_{i}.sv")
-                    for i in test_range if start <= i <= end
-                )
-        return result
+        return [
+            (subdir, f"KnightsTour_tb_{test_num}.sv")
+            for subdir, test_num in FLAT_TESTS[args.type] if start <= test_num <= end
+        ]
 
     def collect_all_tests():
         """
@@ -666,63 +1013,127 @@ def execute_tests(args):
         Returns:
             list: A list of tuples containing the subdirectory and test file for all available tests.
         """
+        # Scan each test subdirectory of this test type once, in the order of TEST_MAPPING.
+        subdirs = dict.fromkeys(subdir for subdir, _ in FLAT_TESTS[args.type])
+
         result = []
-        for directory, test_range in TEST_MAPPING.items():
-            if isinstance(test_range, dict):  # Handle subdirectories for "logic"
-                subdir = "main" if args.type == "m" else "extra"
-                if subdir in test_range:
-                    result.extend(
-                        (f"{directory}/{subdir}", test_file)
-                        for test_file in os.listdir(os.path.join(TEST_DIR, f"{directory}/{subdir}"))
-                        if test_file.startswith("KnightsTour_tb")
-                    )
-            else:  # Simple directories like "simple" or "move"
-                result.extend(
-                    (directory, test_file)
-                    for test_file in os.listdir(os.path.join(TEST_DIR, directory))
-                    if test_file.startswith("KnightsTour_tb")
-                )
+        for subdir in subdirs:
+            result.extend(scan_test_directory(subdir))
         return result
 
     def run_parallel_tests(tests):
-        """Run multiple tests in parallel using threads.
+        """Run multiple tests in parallel, pipelining compilation and simulation.
 
         Args:
             tests (list): A list of tuples containing the subdirectory and test file to run.
 
-        This function uses a ThreadPoolExecutor to run tests concurrently, improving the speed of I/O-bound operations.
+        Tests are compiled and simulated on the shared process pool. Each test is simulated as soon as its
+        compilation finishes, so later tests are still compiling while earlier ones simulate. Processes
+        are used so that the Knight's Tour validation of each test is not serialized on the GIL.
         """
-        with ThreadPoolExecutor(max_workers=28) as executor:  # Increased worker count
-            # Filter tests based on the condition: skip if type is "e" and test number is 0.
-            filtered_tests = [
-                (subdir, test_file) 
-                for subdir, test_file in tests 
-                if not (args.type == "e" and test_file == "KnightsTour_tb_0.sv")
-            ]
-
-            # Submit only the filtered jobs to the executor.
-            futures = [executor.submit(run_test, subdir, test_file, args) for subdir, test_file in filtered_tests]
-            for future in futures:
+        # Filter tests based on the condition: skip if type is "e" and test number is 0.
+        filtered_tests = [
+            (subdir, test_file) 
+            for subdir, test_file in tests 
+            if not (args.type == "e" and test_file == "KnightsTour_tb_0.sv")
+        ]
+
+        # A single test has nothing to overlap with, so run it here instead of starting pool workers for it.
+        if len(filtered_tests) < 2:
+            for subdir, test_file in filtered_tests:
+                messages = ""
                 try:
-                    future.result()  # Will raise an exception if any occurred
+                    compiled, messages, exit_code = run_stage(args.type, compile_test, subdir, test_file, args)
+                    if exit_code is None:
+                        _, simulate_messages, exit_code = run_stage(args.type, simulate_test, *compiled, args)
+                        messages += simulate_messages
                 except Exception as e:
-                    print(f"Test failed with error: {e}")
+                    write_output(f"{messages}Test failed with error: {e}\n")
+                    return
+                write_output(messages)
+                if exit_code is not None:
+                    sys.exit(exit_code)
+            return
+
+        from concurrent.futures import wait, FIRST_COMPLETED
+
+        # Never start more simulations than there are tests or CPUs (or --jobs), so the vsim processes 
+        # do not oversubscribe the machine. GUI simulations (mode 2) hold their worker until the window is 
+        # closed though, so there every test gets a worker and all windows open at once.
+        if args.mode == 2:
+            num_jobs = len(filtered_tests)
+        else:
+            num_jobs = max(1, min(args.jobs or os.cpu_count() or 4, len(filtered_tests)))
+
+        # Compile at most 4 tests at a time, simulating each test on the same pool as soon as it has compiled.
+        pool = get_pool(num_jobs, args.type)
+        tests_to_compile = iter(filtered_tests)
+        compile_futures = set()
+        simulate_futures = {}
+        failed_exit_code = None
+
+        while True:
+            # Keep the compile stage filled up with the next tests.
+            while len(compile_futures) < min(num_jobs, 4):
+                test = next(tests_to_compile, None)
+                if test is None:
+                    break
+                compile_futures.add(pool.submit(run_stage, args.type, compile_test, *test, args))
+
+            if not compile_futures and not simulate_futures:
+                break
+
+            done, _ = wait(compile_futures | simulate_futures.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in compile_futures:
+                    # Hand the test over to the simulation stage now that it has compiled.
+                    compile_futures.remove(future)
+                    try:
+                        compiled, messages, exit_code = future.result()  # Will raise an exception if any occurred
+                    except Exception as e:
+                        write_output(f"Test failed with error: {e}\n")
+                        continue
+                    if exit_code is not None:
+                        write_output(messages)  # Show why the compilation failed, exit once the other tests are done.
+                        failed_exit_code = exit_code
+                        continue
+                    test_num, test_name, log_file = compiled
+                    simulate_futures[pool.submit(run_stage, args.type, simulate_test, test_num, test_name, log_file, args)] = messages
+                else:
+                    # Write out the messages of the test in one go now that it has finished.
+                    messages = simulate_futures.pop(future)
+                    try:
+                        _, simulate_messages, exit_code = future.result()  # Will raise an exception if any occurred
+                    except Exception as e:
+                        write_output(f"{messages}Test failed with error: {e}\n")
+                        continue
+                    write_output(messages + simulate_messages)
+                    if exit_code is not None:
+                        failed_exit_code = exit_code
+
+        # Exit with the failure of a test that aborted, as the test would have when run on its own.
+        if failed_exit_code is not None:
+            sys.exit(failed_exit_code)
 
     def view_parallel_waves(test_numbers):
-        """View waveforms for multiple tests in parallel using threads.
+        """View waveforms for multiple tests in parallel.
 
         Args:
             test_numbers (list): A list of test numbers for which to view the waveforms.
 
-        This function uses a ThreadPoolExecutor to view waveforms concurrently, improving the speed of I/O-bound operations.
+        This function launches every waveform viewer at once and then waits on them, so no thread is 
+        held per viewer while they are open.
         """
-        with ThreadPoolExecutor(max_workers=28) as executor:  # Increased worker count
-            futures = [executor.submit(view_waveforms, i, args) for i in test_numbers]
-            for future in futures:
-                try:
-                    future.result()  # Will raise an exception if any occurred
-                except Exception as e:
-                    print(f"Waveform view failed with error: {e}")
+        viewers = []
+        for i in test_numbers:
+            try:
+                viewers.append(view_waveforms(i, args))
+            except Exception as e:
+                print(f"Waveform view failed with error: {e}")
+
+        for viewer in viewers:
+            if viewer.wait() != 0:
+                print(f"Waveform view failed with error: {subprocess.CalledProcessError(viewer.returncode, viewer.args)}")
 
     def run_specific_test(test_num):
         """Run a specific test by its number.
@@ -758,33 +1169,19 @@ def execute_tests(args):
             all_tests = get_all_test_numbers()
             view_parallel_waves(all_tests)
 
-    # Handle different cases based on parsed arguments.
-    if args.number is not None:
-        # If a specific test number is provided, run that test.
-        if args.mode == 3:
-            # Mode 3: View waveforms for the specific test.
-            handle_mode_3([args.number])
-        else:
-            # Run the specific test.
-            run_specific_test(args.number)
-    elif args.range is not None:
-        # If a range of tests is provided, run all tests in that range.
-        start, end = args.range
-        if args.mode == 3:
-            # Mode 3: View waveforms for the test range.
-            handle_mode_3(list(range(start, end + 1)))
-        else:
-            # Collect and run the tests in the specified range.
-            tests = get_tests_in_range(start, end)
-            run_parallel_tests(tests)  # Parallel execution for faster results.
-    else:
-        # If no specific test or range is provided, run all tests.
-        if args.mode == 3:
-            handle_mode_3()
-        else:                
-            # Collect and run all tests.
-            tests = collect_all_tests()
-            run_parallel_tests(tests)  # Parallel execution for faster results.
+    # Handle the different cases based on parsed arguments: a specific test number, a range of tests, or 
+    # all tests, either viewing their waveforms (mode 3) or running them. Ranges and all tests are run in 
+    # parallel for faster results.
+    handlers = {
+        (True, "number"): lambda: handle_mode_3([args.number]),
+        (False, "number"): lambda: run_specific_test(args.number),
+        (True, "range"): lambda: handle_mode_3(list(range(args.range[0], args.range[1] + 1))),
+        (False, "range"): lambda: run_parallel_tests(get_tests_in_range(*args.range)),
+        (True, "all"): lambda: handle_mode_3(),
+        (False, "all"): lambda: run_parallel_tests(collect_all_tests()),
+    }
+    selection = "number" if args.number is not None else "range" if args.range is not None else "all"
+    handlers[(args.mode == 3, selection)]()
 
 
 def print_mode_message(args, range_desc=None):
@@ -801,43 +1198,63 @@ def print_mode_message(args, range_desc=None):
     Returns:
         None
     """
+    # Only the parent process announces the run, the main/extra workers of an "all" run stay quiet.
+    if args.child:
+        return
+
     try:
-        mode_labels = ["command-line", "saving", "GUI"]
-        # Handle messages for all tests (-a flag).
+        # Single tests announce their own mode when they run.
+        if args.number is not None:
+            return
+
+        # Describe the tests being run, e.g. "all tests", "all main tests" or "extra tests from 2 to 5".
         if args.type == "a":
-            if not range_desc and args.number is None:
-                if args.mode != 3:
-                    print(f"Running all tests in {mode_labels[args.mode]} mode...")
-                else:
-                    print("Viewing waveforms for all tests...")
-            elif args.number is None:
-                if args.mode != 3:
-                    print(f"Running all tests {range_desc} in {mode_labels[args.mode]} mode...")
-                else:
-                    print(f"Viewing waveforms for all tests {range_desc}...")
-        # Handle messages for specific test types ('main' or 'extra').
-        elif args.type in {"m", "e"}:
-            test_label = "main" if args.type == "m" else "extra"
-            if not range_desc and args.number is None:
-                if args.mode != 3:
-                    print(f"Running all {test_label} tests in {mode_labels[args.mode]} mode...")
-                else:
-                    print(f"Viewing waveforms for all {test_label} tests...")
-            elif args.number is None:
-                if args.mode != 3:
-                    print(f"Running {test_label} tests {range_desc} in {mode_labels[args.mode]} mode...")
-                else:
-                    print(f"Viewing waveforms for {test_label} tests {range_desc}...")
+            tests = "all tests"
+        else:
+            tests = f"{'main' if args.type == 'm' else 'extra'} tests"
+            if not range_desc:
+                tests = f"all {tests}"
+        if range_desc:
+            tests += f" {range_desc}"
+
+        if args.mode != 3:
+            print(f"Running {tests} in {_MODE_NAMES[args.mode]} mode...")
+        else:
+            print(f"Viewing waveforms for {tests}...")
     except Exception as e:
         print(f"Printing message failed with error: {e}")
         sys.exit(1)
 
 
+def run_typed_tests(args):
+    """
+    Runs the tests of a single type for run_all_tests, in a worker process or in this one.
+
+    Args:
+        args (argparse.Namespace): Arguments for the tests of this type, with child set.
+
+    Returns:
+        int: The exit code the tests would have exited the script with, 0 if they all completed.
+    """
+    try:
+        run_specific_tests(args)
+    except SystemExit as e:
+        return e.code
+    finally:
+        # The worker outlives the tests, so make sure their output is written out now. Its own pool is
+        # shut down as well, since a pool worker waits for its child processes before it can exit, and
+        # a run in this process must not hand workers set up for this type to the next one.
+        shutdown_pool()
+        sys.stdout.flush()
+    return 0
+
+
 def run_all_tests(args):
     """
     Executes all tests (both main and extra) in parallel.
 
-    Spawns separate child processes to run main and extra tests in parallel.
+    Runs the main and extra tests in parallel on separate worker processes, or
+    one after the other when only one test may be simulated at a time.
     Ensures all processes complete successfully before proceeding.
 
     Args:
@@ -846,20 +1263,51 @@ def run_all_tests(args):
     Returns:
         None
     """
-    base_args = sys.argv[1:]  # Get command-line arguments excluding the script name.
-
-    # Prepare arguments for main and extra test child processes.
-    args_main = base_args + ["-t", "m", "--child"]
-    args_extra = base_args + ["-t", "e", "--child"]
-
-    # Execute main and extra tests in parallel using ProcessPoolExecutor.
-    with ProcessPoolExecutor(max_workers=24) as executor:
+    # Prepare arguments for the main and extra test workers from the parsed arguments, splitting the 
+    # parallel simulations between them so together they do not run more than --jobs (or the number of CPUs).
+    # Main tests get the extra simulation of an odd budget.
+    max_jobs = args.jobs or os.cpu_count() or 4
+    args_main = copy.copy(args)
+    args_main.type = "m"
+    args_main.child = True
+    args_main.jobs = (max_jobs + 1) // 2
+
+    args_extra = copy.copy(args_main)
+    args_extra.type = "e"
+    args_extra.jobs = max(1, max_jobs // 2)
+
+    failed_exit_code = None
+    if max_jobs == 1 and args.mode in (0, 1):
+        # A single simulation at a time leaves nothing to split, so run the main tests and then the extra
+        # tests in this process. GUI and waveform windows stay open until closed, so those modes still
+        # open both test types at once below.
+        for typed_args in (args_main, args_extra):
+            exit_code = run_typed_tests(typed_args)
+            if exit_code:
+                failed_exit_code = exit_code
+    else:
+        # Execute main and extra tests in parallel on the process pool, one worker for each test type. 
+        # The workers run the tests directly instead of starting a new interpreter for the script.
+        from concurrent.futures import as_completed
+        executor = get_pool(2)
         futures = [
-            executor.submit(subprocess.run, [sys.executable, __file__, *args_main]),
-            executor.submit(subprocess.run, [sys.executable, __file__, *args_extra])
+            executor.submit(run_typed_tests, args_main),
+            executor.submit(run_typed_tests, args_extra)
         ]
-        for future in futures:
-            future.result()  # Ensure all processes complete successfully.
+        # Reap each test type as soon as it finishes, whichever finishes first. The executor already waits on
+        # both worker processes at once through their sentinels.
+        for future in as_completed(futures):
+            try:
+                exit_code = future.result()  # Will raise an exception if any occurred
+            except Exception as e:
+                print(f"Test run failed with error: {e}")
+                exit_code = 1
+            if exit_code:
+                failed_exit_code = exit_code
+
+    # Exit with the failure of a test type that aborted, as the script would have for that type on its own.
+    if failed_exit_code is not None:
+        sys.exit(failed_exit_code)
 
     # Print a completion message unless running in waveform viewing mode (mode 3).
     if args.mode != 3:
@@ -909,8 +1357,7 @@ def main():
     range_desc = f"from {args.range[0]} to {args.range[1]}" if args.range else None
 
     # Print the mode message for the parent process.
-    if not args.child:
-        print_mode_message(args, range_desc)
+    print_mode_message(args, range_desc)
 
     # Execute all tests or specific tests based on the `type` argument.
     if args.type == "a":